@@ -37,6 +37,7 @@ from PyQt6.QtCore import QT_TRANSLATE_NOOP, QCoreApplication
 from novelwriter import CONFIG
 from novelwriter.common import checkUuid, isHandle, jsonEncode
 from novelwriter.constants import nwFiles, nwHeadFmt, nwStyles
+from novelwriter.core.item import NWItem
 from novelwriter.core.project import NWProject
 from novelwriter.enum import nwBuildFmt
 from novelwriter.error import logException
@@ -403,10 +404,7 @@ class BuildSettings:
         if not isinstance(project, NWProject):
             return result
 
-        incNovel = bool(self.getBool("filter.includeNovel"))
-        incNotes = bool(self.getBool("filter.includeNotes"))
-        incInactive = bool(self.getBool("filter.includeInactive"))
-
+        flags = self._filterFlags()
         postponed = []
 
         def allowRoot(rHandle: str | None) -> None:
@@ -416,36 +414,32 @@ class BuildSettings:
 
         for item in project.tree:
             tHandle = item.itemHandle
-            if item.isInactiveClass() or (item.itemRoot in self._skipRoot):
-                result[tHandle] = (False, FilterMode.SKIPPED)
-                continue
-            if withRoots and item.isRootType():
+            if withRoots and item.isRootType() and not self._isSkipped(item):
                 result[tHandle] = (False, FilterMode.SKIPPED)
                 postponed.append(tHandle)
                 continue
-            if not item.isFileType():
-                result[tHandle] = (False, FilterMode.SKIPPED)
-                continue
-            if tHandle in self._included:
-                result[tHandle] = (True, FilterMode.INCLUDED)
-                allowRoot(item.itemRoot)
-                continue
-            if tHandle in self._excluded:
-                result[tHandle] = (False, FilterMode.EXCLUDED)
-                continue
 
-            isNote = item.isNoteLayout()
-            isNovel = item.isDocumentLayout()
-            isActive = item.isActive
+            result[tHandle] = decision = self._filterItem(item, *flags)
+            if decision[0]:
+                allowRoot(item.itemRoot)
 
-            byActive = isActive or (not isActive and incInactive)
-            byLayout = (isNote and incNotes) or (isNovel and incNovel)
+        return result
 
-            isAllowed = byActive and byLayout
+    def filterItems(
+        self, project: NWProject, handles: Iterable[str]
+    ) -> dict[str, tuple[bool, FilterMode]]:
+        """Return the filter decisions for a set of item handles, as
+        buildItemFilter does without roots. Unknown handles are left
+        out.
+        """
+        result: dict[str, tuple[bool, FilterMode]] = {}
+        if not isinstance(project, NWProject):
+            return result
 
-            result[tHandle] = (isAllowed, FilterMode.FILTERED)
-            if isAllowed:
-                allowRoot(item.itemRoot)
+        flags = self._filterFlags()
+        for tHandle in handles:
+            if item := project.tree[tHandle]:
+                result[tHandle] = self._filterItem(item, *flags)
 
         return result
 
@@ -517,6 +511,44 @@ class BuildSettings:
         cls._name = f"{source.name} 2"
         return cls
 
+    ##
+    #  Internal Functions
+    ##
+
+    def _filterFlags(self) -> tuple[bool, bool, bool]:
+        """Return the include novel, notes and inactive filter flags."""
+        return (
+            bool(self.getBool("filter.includeNovel")),
+            bool(self.getBool("filter.includeNotes")),
+            bool(self.getBool("filter.includeInactive")),
+        )
+
+    def _isSkipped(self, item: NWItem) -> bool:
+        """Check if an item is in an inactive or skipped root."""
+        return item.isInactiveClass() or item.itemRoot in self._skipRoot
+
+    def _filterItem(
+        self, item: NWItem, incNovel: bool, incNotes: bool, incInactive: bool
+    ) -> tuple[bool, FilterMode]:
+        """Return the filter decision for a single item."""
+        if self._isSkipped(item) or not item.isFileType():
+            return False, FilterMode.SKIPPED
+
+        tHandle = item.itemHandle
+        if tHandle in self._included:
+            return True, FilterMode.INCLUDED
+        if tHandle in self._excluded:
+            return False, FilterMode.EXCLUDED
+
+        isNote = item.isNoteLayout()
+        isNovel = item.isDocumentLayout()
+        isActive = item.isActive
+
+        byActive = isActive or (not isActive and incInactive)
+        byLayout = (isNote and incNotes) or (isNovel and incNovel)
+
+        return byActive and byLayout, FilterMode.FILTERED
+
 
 class BuildCollection:
     """Core: Build Collection Class
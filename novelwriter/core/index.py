@@ -625,12 +625,17 @@ class Index:
         section.
         """
         tRefs = {x: [] for x in nwKeyWords.VALID_KEYS}
-        for rTitle, hItem in self._itemIndex.iterItemHeaders(tHandle):
-            if sTitle is None or sTitle == rTitle:
-                for aTag, refTypes in hItem.references.items():
-                    for refType in refTypes:
-                        if refType in tRefs:
-                            tRefs[refType].append(self._tagsIndex.tagName(aTag))
+        if sTitle is None:
+            headings = [hItem for _, hItem in self._itemIndex.iterItemHeaders(tHandle)]
+        elif hItem := self.getItemHeading(tHandle, sTitle):
+            headings = [hItem]
+        else:
+            headings = []
+        for hItem in headings:
+            for aTag, refTypes in hItem.references.items():
+                for refType in refTypes:
+                    if refType in tRefs:
+                        tRefs[refType].append(self._tagsIndex.tagName(aTag))
         return tRefs
 
     def getReferenceForHeader(self, tHandle: str, nHead: int, keyClass: str) -> list[str]:
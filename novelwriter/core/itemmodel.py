@@ -215,16 +215,16 @@ class ProjectNode:
         if 0 <= pos < len(self._children):
             self._children.insert(pos, child)
         else:
-            child._row = len(self._children)
+            pos = len(self._children)
             self._children.append(child)
-        self._refreshChildrenPos()
+        self._refreshChildrenPos(pos)
         return
 
     def takeChild(self, pos: int) -> ProjectNode | None:
         """Remove a child item and return it."""
         if 0 <= pos < len(self._children):
             node = self._children.pop(pos)
-            self._refreshChildrenPos()
+            self._refreshChildrenPos(pos)
             self.updateCount()
             return node
         return None
@@ -235,7 +235,7 @@ class ProjectNode:
         if (source != target) and (0 <= source < count) and (0 <= target <= count):
             node = self._children.pop(source)
             self._children.insert(target, node)
-            self._refreshChildrenPos()
+            self._refreshChildrenPos(min(source, target))
         return
 
     def setExpanded(self, state: bool) -> None:
@@ -257,9 +257,12 @@ class ProjectNode:
             node._recursiveAppendChildren(children)
         return
 
-    def _refreshChildrenPos(self) -> None:
-        """Update the row value on all children."""
-        for n, child in enumerate(self._children):
+    def _refreshChildrenPos(self, start: int) -> None:
+        """Update the row value on all children from a given position.
+        Children before that position are unaffected by the change.
+        """
+        for n in range(start, len(self._children)):
+            child = self._children[n]
             child._row = n
             child.item.setOrder(n)
         return
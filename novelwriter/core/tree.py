@@ -67,7 +67,7 @@ class NWTree:
         self._model = ProjectModel(self)
         self._items: dict[str, NWItem] = {}
         self._nodes: dict[str, ProjectNode] = {}
-        self._trash = None
+        self._trash: ProjectNode | None = None
         logger.debug("Ready: NWTree")
         return
 
@@ -87,8 +87,8 @@ class NWTree:
         """Return a project item based on its handle. Returns None if
         the handle doesn't exist in the project.
         """
-        if tHandle and tHandle in self._items:
-            return self._items[tHandle]
+        if tHandle and (item := self._items.get(tHandle)) is not None:
+            return item
         logger.error("No tree item with handle '%s'", str(tHandle))
         return None
 
@@ -109,9 +109,9 @@ class NWTree:
     @property
     def trash(self) -> ProjectNode | None:
         """Return trash node, if it exists."""
-        if self._trash:
-            return self._trash
-        return self._getTrashNode()
+        if self._trash is None:
+            self._trash = self._getTrashNode()
+        return self._trash
 
     @property
     def model(self) -> ProjectModel:
@@ -167,6 +167,8 @@ class NWTree:
             index = self._model.indexFromNode(node)
             if index.isValid() and self._model.removeChild(index.parent(), index.row()):
                 self._itemChange(node.item, nwChange.DELETE)
+                if node is self._trash:
+                    self._trash = None
                 del self._nodes[tHandle]
                 del self._items[tHandle]
                 return True
@@ -287,7 +289,7 @@ class NWTree:
         mark recovered files.
         """
         storage = self._project.storage
-        remains = set(storage.scanContent()).difference(set(self._nodes.keys()))
+        remains = set(storage.scanContent()).difference(self._nodes)
         orphans = len(remains)
         if orphans == 0:
             logger.info("Checked project files: OK")
@@ -336,33 +338,31 @@ class NWTree:
         if not (isinstance(contentPath, Path) and isinstance(runtimePath, Path)):
             return False
 
-        entries = []
-        maxLen = 0
-        for node in self._model.root.allChildren():
-            item = node.item
-            file = f"{item.itemHandle}.nwd"
-            if (contentPath / file).is_file():
-                tocLine = "{0:<25s}  {1:<9s}  {2:<8s}  {3:s}".format(
-                    f"content/{file}",
-                    item.itemClass.name,
-                    item.itemLayout.name,
-                    item.itemName,
-                )
-                entries.append(tocLine)
-                maxLen = max(maxLen, len(tocLine))
+        present = set(self._project.storage.scanContent())
+        items = [
+            node.item for node in self._model.root.allChildren()
+            if node.item.itemHandle in present
+        ] if present else []
+        entries = [
+            f"{'content/' + item.itemHandle + '.nwd':<25s}  {item.itemClass.name:<9s}  "
+            f"{item.itemLayout.name:<8s}  {item.itemName}"
+            for item in items
+        ]
+        maxLen = max(map(len, entries), default=0)
+
+        lines = [
+            "",
+            "Table of Contents",
+            "=================",
+            "",
+            f"{'File Name':<25s}  {'Class':<9s}  {'Layout':<8s}  Document Label",
+            "-"*max(maxLen, 62),
+        ]
+        lines.extend(entries)
 
         try:
             with open(runtimePath / nwFiles.TOC_TXT, mode="w", encoding="utf-8") as toc:
-                toc.write("\n")
-                toc.write("Table of Contents\n")
-                toc.write("=================\n")
-                toc.write("\n")
-                toc.write("{0:<25s}  {1:<9s}  {2:<8s}  {3:s}\n".format(
-                    "File Name", "Class", "Layout", "Document Label"
-                ))
-                toc.write("-"*max(maxLen, 62) + "\n")
-                toc.write("\n".join(entries))
-                toc.write("\n")
+                toc.write("\n".join(lines) + "\n")
 
         except Exception:
             logger.error("Could not write ToC file")
@@ -388,7 +388,7 @@ class NWTree:
 
     def checkType(self, tHandle: str, itemType: nwItemType) -> bool:
         """Check if item exists and is of the specified item type."""
-        if tItem := self.__getitem__(tHandle):
+        if tItem := self._items.get(tHandle):
             return tItem.itemType == itemType
         return False
 
@@ -402,12 +402,11 @@ class NWTree:
         if node := self._nodes.get(tHandle):
             for _ in range(MAX_DEPTH):
                 if parent := node.parent():
-                    path.append(node.item.itemName if asName else tHandle)
+                    path.append(node.item.itemName if asName else node.item.itemHandle)
                     node = parent
                 else:
                     return path
-            else:
-                logger.error("Max project tree depth reached")
+            logger.error("Max project tree depth reached")
         return path
 
     def subTree(self, tHandle: str) -> list[str]:
@@ -422,10 +421,7 @@ class NWTree:
 
     def rootClasses(self) -> set[nwItemClass]:
         """Return a set of all root classes in use by the project."""
-        rootClasses = set()
-        for node in self._model.root.children:
-            rootClasses.add(node.item.itemClass)
-        return rootClasses
+        return {node.item.itemClass for node in self._model.root.children}
 
     def iterRoots(self, itemClass: nwItemClass | None) -> Iterable[tuple[str, NWItem]]:
         """Iterate over all root items of a given class in order."""
@@ -496,8 +492,7 @@ class NWTree:
         """
         logger.debug("Generating new handle")
         handle = f"{random.getrandbits(52):013x}"
-        if handle in self._items:
+        while handle in self._items:
             logger.warning("Duplicate handle encountered! Retrying ...")
-            handle = self._makeHandle()
-
+            handle = f"{random.getrandbits(52):013x}"
         return handle
@@ -25,6 +25,8 @@ from __future__ import annotations
 
 import logging
 
+from pathlib import Path
+
 from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import (
     QDialogButtonBox, QHBoxLayout, QLabel, QTextBrowser, QVBoxLayout, QWidget
@@ -39,6 +41,9 @@ from novelwriter.types import QtAlignRightTop, QtDialogClose, QtHexArgb
 
 logger = logging.getLogger(__name__)
 
+# Static assets that don't change during a session
+_HTML_CACHE: dict[Path, str] = {}
+
 
 class GuiAbout(NDialog):
 
@@ -127,7 +132,10 @@ class GuiAbout(NDialog):
 
     def _fillCreditsPage(self) -> None:
         """Load the content for the Credits page."""
-        if html := readTextFile(CONFIG.assetPath("text") / "credits_en.htm"):
+        docPath = CONFIG.assetPath("text") / "credits_en.htm"
+        if docPath not in _HTML_CACHE and (text := readTextFile(docPath)):
+            _HTML_CACHE[docPath] = text
+        if html := _HTML_CACHE.get(docPath):
             self.txtCredits.setHtml(html)
         else:
             self.txtCredits.setHtml("Error loading credits text ...")
@@ -42,6 +42,7 @@ from novelwriter.constants import nwConst
 logger = logging.getLogger(__name__)
 
 API_URL = "https://api.github.com/repos/vkbo/novelwriter/releases/latest"
+RELEASE_DATE = datetime.strptime(__date__, "%Y-%m-%d")
 
 
 class VersionInfoWidget(QWidget):
@@ -57,7 +58,7 @@ class VersionInfoWidget(QWidget):
         # Labels
         self._lblInfo = QLabel("{0} {1} \u2013 {2} {3} \u2013 {4}".format(
             self.tr("Version"), formatVersion(__version__),
-            self.tr("Released on"), CONFIG.localDate(datetime.strptime(__date__, "%Y-%m-%d")),
+            self.tr("Released on"), CONFIG.localDate(RELEASE_DATE),
             "<a href='#notes'>{0}</a>".format(self.tr("Release Notes")),
         ), self)
         self._lblInfo.linkActivated.connect(self._processLink)
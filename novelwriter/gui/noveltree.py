@@ -6,6 +6,7 @@ File History:
 Created: 2020-12-20 [1.1rc1] GuiNovelTree
 Created: 2022-06-12 [2.0rc1] GuiNovelView
 Created: 2022-06-12 [2.0rc1] GuiNovelToolBar
+Created: 2026-10-14 [2.7a3]  NovelTreeModel
 
 This file is a part of novelWriter
 Copyright (C) 2020 Veronica Berglyd Olsen and novelWriter contributors
@@ -29,12 +30,19 @@ import logging
 
 from enum import Enum
 from time import time
+from typing import Any
 
-from PyQt6.QtCore import QModelIndex, QPoint, Qt, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QActionGroup, QFocusEvent, QFont, QMouseEvent, QPalette, QResizeEvent
+from PyQt6.QtCore import (
+    QAbstractTableModel, QItemSelection, QItemSelectionModel, QModelIndex,
+    QObject, QPoint, Qt, QTimer, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import (
+    QActionGroup, QBrush, QFocusEvent, QFont, QMouseEvent, QPalette,
+    QResizeEvent, QShowEvent
+)
 from PyQt6.QtWidgets import (
     QAbstractItemView, QFrame, QHBoxLayout, QInputDialog, QMenu, QToolTip,
-    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
+    QTreeView, QVBoxLayout, QWidget
 )
 
 from novelwriter import CONFIG, SHARED
@@ -46,9 +54,10 @@ from novelwriter.extensions.modified import NIconToolButton
 from novelwriter.extensions.novelselector import NovelSelector
 from novelwriter.gui.theme import STYLES_MIN_TOOLBUTTON
 from novelwriter.types import (
-    QtAlignRight, QtDecoration, QtHeaderStretch, QtHeaderToContents,
-    QtMouseLeft, QtMouseMiddle, QtScrollAlwaysOff, QtScrollAsNeeded,
-    QtSizeExpanding, QtUserRole
+    QtAlignRight, QtBackground, QtDecoration, QtDisplay, QtFontRole,
+    QtHeaderStretch, QtHeaderToContents, QtMouseLeft, QtMouseMiddle,
+    QtScrollAlwaysOff, QtScrollAsNeeded, QtSizeExpanding, QtTextAlignment,
+    QtToolTip, QtUserRole
 )
 
 logger = logging.getLogger(__name__)
@@ -347,7 +356,7 @@ class GuiNovelToolBar(QWidget):
         return
 
 
-class GuiNovelTree(QTreeWidget):
+class GuiNovelTree(QTreeView):
 
     C_DATA  = 0
     C_TITLE = 0
@@ -360,6 +369,22 @@ class GuiNovelTree(QTreeWidget):
     D_KEY    = QtUserRole + 2
     D_EXTRA  = QtUserRole + 3
 
+    # Shared keys for the model row data
+    R_HANDLE = (C_DATA, D_HANDLE)
+    R_TITLE  = (C_DATA, D_TITLE)
+    R_KEY    = (C_DATA, D_KEY)
+    R_EXTRA  = (C_DATA, D_EXTRA)
+    R_HDEC   = (C_TITLE, QtDecoration)
+    R_HTEXT  = (C_TITLE, QtDisplay)
+    R_HFONT  = (C_TITLE, QtFontRole)
+    R_WORDS  = (C_WORDS, QtDisplay)
+    R_WALIGN = (C_WORDS, QtTextAlignment)
+    R_ETEXT  = (C_EXTRA, QtDisplay)
+    R_ETIP   = (C_EXTRA, QtToolTip)
+    R_MORE   = (C_MORE, QtDecoration)
+
+    BATCH_SIZE = 500
+
     def __init__(self, novelView: GuiNovelView) -> None:
         super().__init__(parent=novelView)
 
@@ -372,7 +397,14 @@ class GuiNovelTree(QTreeWidget):
         self._lastCol     = NovelTreeColumn.POV
         self._lastColSize = 0.25
         self._actHandle   = None
-        self._treeMap: dict[str, QTreeWidgetItem] = {}
+        self._dirty       = False
+
+        # Build State
+        self._buildList: list[tuple[str, str, str, IndexHeading]] = []
+        self._buildPos   = 0
+        self._buildCache: dict[str, dict[tuple[int, int], Any]] = {}
+        self._buildStart = 0.0
+        self._selectKey: str | None = None
 
         # Cached Strings
         self._povLabel = trConst(nwLabels.KEY_NAME[nwKeyWords.POV_KEY])
@@ -385,13 +417,15 @@ class GuiNovelTree(QTreeWidget):
         iPx = SHARED.theme.baseIconHeight
         iSz = SHARED.theme.baseIconSize
 
+        self._model = NovelTreeModel(self)
+        self.setModel(self._model)
+
         self.setIconSize(iSz)
         self.setFrameStyle(QFrame.Shape.NoFrame)
         self.setUniformRowHeights(True)
         self.setAllColumnsShowFocus(True)
         self.setHeaderHidden(True)
         self.setIndentation(2)
-        self.setColumnCount(4)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.setExpandsOnDoubleClick(False)
@@ -416,10 +450,17 @@ class GuiNovelTree(QTreeWidget):
 
         self._hFonts = [self.font(), fH1, fH2, self.font(), self.font()]
 
+        # Batch Build Timer
+        self._timerBuild = QTimer(self)
+        self._timerBuild.setSingleShot(True)
+        self._timerBuild.setInterval(0)
+        self._timerBuild.timeout.connect(self._populateBatch)
+
         # Connect signals
         self.clicked.connect(self._treeItemClicked)
-        self.itemDoubleClicked.connect(self._treeDoubleClick)
-        self.itemSelectionChanged.connect(self._treeSelectionChange)
+        self.doubleClicked.connect(self._treeDoubleClick)
+        if selModel := self.selectionModel():
+            selModel.selectionChanged.connect(self._treeSelectionChange)
 
         # Set custom settings
         self.initSettings()
@@ -468,53 +509,83 @@ class GuiNovelTree(QTreeWidget):
 
     def clearContent(self) -> None:
         """Clear the GUI content and the related maps."""
-        self.clear()
-        self._treeMap = {}
+        self._timerBuild.stop()
+        self._buildList = []
+        self._buildPos = 0
+        self._buildCache = {}
+        self._selectKey = None
+        self._model.clear()
         self._lastBuild = 0
+        self._dirty = False
         return
 
     def refreshTree(self, rootHandle: str | None = None, overRide: bool = False) -> None:
-        """Refresh the tree if it has been changed."""
+        """Refresh the tree if it has been changed. If the tree is not
+        visible, the refresh is deferred until it is shown.
+        """
         logger.debug("Requesting refresh of the novel tree")
         if rootHandle is None:
             rootHandle = SHARED.project.tree.findRoot(nwItemClass.NOVEL)
 
-        titleKey = None
-        if selItems := self.selectedItems():
-            titleKey = selItems[0].data(self.C_DATA, self.D_KEY)
-
-        self._populateTree(rootHandle)
         SHARED.project.data.setLastHandle(rootHandle, "novelTree")
+        if not self.isVisible():
+            logger.debug("Novel tree is hidden, deferring refresh")
+            self._dirty = True
+            return
 
-        if titleKey is not None and titleKey in self._treeMap:
-            self._treeMap[titleKey].setSelected(True)
+        if selIndexes := self.selectedIndexes():
+            self._selectKey = selIndexes[0].siblingAtColumn(self.C_DATA).data(self.D_KEY)
+
+        self._dirty = False
+        self._populateTree(rootHandle)
 
         return
 
     def refreshHandle(self, tHandle: str) -> None:
         """Refresh the data for a given handle."""
+        if self._dirty:
+            # The deferred rebuild will pick up the new data
+            return
         if idxData := SHARED.project.index.getItemData(tHandle):
             logger.debug("Refreshing meta data for item '%s'", tHandle)
+            keys = []
+            pending: dict[str, int] | None = None
             for sTitle, tHeading in idxData.items():
                 sKey = f"{tHandle}:{sTitle}"
-                if trItem := self._treeMap.get(sKey, None):
-                    self._updateTreeItemValues(trItem, tHeading, tHandle, sTitle)
+                if (row := self._model.row(sKey)) is not None:
+                    before = row.copy()
+                    self._updateRowValues(row, tHeading, tHandle, sTitle)
+                    if row != before:
+                        keys.append(sKey)
+                    continue
+
+                if pending is None:
+                    pending = {
+                        entry[0]: i for i, entry in enumerate(
+                            self._buildList[self._buildPos:], self._buildPos
+                        )
+                    }
+                if (i := pending.get(sKey)) is not None:
+                    # The row is not added yet, so update the build entry
+                    self._buildList[i] = (sKey, tHandle, sTitle, tHeading)
                 else:
                     logger.debug("Heading '%s' not in novel tree", sKey)
-                    self.refreshTree()
+                    self.refreshTree(
+                        rootHandle=SHARED.project.data.getLastHandle("novelTree")
+                    )
                     return
+            self._model.refreshRows(keys)
         return
 
     def getSelectedHandle(self) -> tuple[str | None, str | None]:
         """Get the currently selected or active handle. If multiple
         items are selected, return the first.
         """
-        selList = self.selectedItems()
-        trItem = selList[0] if selList else self.currentItem()
-        if isinstance(trItem, QTreeWidgetItem):
-            tHandle = trItem.data(self.C_DATA, self.D_HANDLE)
-            sTitle = trItem.data(self.C_DATA, self.D_TITLE)
-            return tHandle, sTitle
+        selList = self.selectedIndexes()
+        index = selList[0] if selList else self.currentIndex()
+        if index.isValid():
+            index = index.siblingAtColumn(self.C_DATA)
+            return index.data(self.D_HANDLE), index.data(self.D_TITLE)
         return None, None
 
     def setLastColType(self, colType: NovelTreeColumn, doRefresh: bool = True) -> None:
@@ -535,23 +606,10 @@ class GuiNovelTree(QTreeWidget):
 
     def setActiveHandle(self, tHandle: str | None) -> None:
         """Highlight the rows associated with a given handle."""
-        didScroll = False
-        brushOn = self.palette().alternateBase()
-        brushOff = self.palette().base()
-        if pHandle := self._actHandle:
-            for key, item in self._treeMap.items():
-                if key.startswith(pHandle):
-                    for i in range(self.columnCount()):
-                        item.setBackground(i, brushOff)
-        if tHandle:
-            for key, item in self._treeMap.items():
-                if key.startswith(tHandle):
-                    for i in range(self.columnCount()):
-                        item.setBackground(i, brushOn)
-                    if not didScroll:
-                        self.scrollToItem(item, QAbstractItemView.ScrollHint.PositionAtCenter)
-                        didScroll = True
         self._actHandle = tHandle or None
+        brush = self.palette().alternateBase()
+        if (index := self._model.setActiveHandle(self._actHandle, brush)).isValid():
+            self.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
         return
 
     ##
@@ -571,8 +629,8 @@ class GuiNovelTree(QTreeWidget):
                 self.clearSelection()
 
         elif event.button() == QtMouseMiddle:
-            selItem = self.itemAt(event.pos())
-            if not isinstance(selItem, QTreeWidgetItem):
+            selItem = self.indexAt(event.pos())
+            if not selItem.isValid():
                 return
 
             tHandle, sTitle = self.getSelectedHandle()
@@ -583,6 +641,13 @@ class GuiNovelTree(QTreeWidget):
 
         return
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Run a refresh that was deferred while the tree was hidden."""
+        super().showEvent(event)
+        if self._dirty:
+            self.refreshTree(rootHandle=SHARED.project.data.getLastHandle("novelTree"))
+        return
+
     def focusOutEvent(self, event: QFocusEvent) -> None:
         """Clear the selection when the tree no longer has focus."""
         super().focusOutEvent(event)
@@ -597,14 +662,11 @@ class GuiNovelTree(QTreeWidget):
         if newW != oldW:
             eliW = int(self._lastColSize * newW)
             fMetric = self.fontMetrics()
-            for i in range(self.topLevelItemCount()):
-                trItem = self.topLevelItem(i)
-                if isinstance(trItem, QTreeWidgetItem):
-                    lastText = trItem.data(self.C_DATA, self.D_EXTRA)
-                    trItem.setText(
-                        self.C_EXTRA,
-                        fMetric.elidedText(lastText, Qt.TextElideMode.ElideRight, eliW)
-                    )
+            for row in self._model.rows():
+                row[self.R_ETEXT] = fMetric.elidedText(
+                    row.get(self.R_EXTRA, ""), Qt.TextElideMode.ElideRight, eliW
+                )
+            self._model.refreshColumn(self.C_EXTRA)
         return
 
     ##
@@ -621,8 +683,8 @@ class GuiNovelTree(QTreeWidget):
             self._popMetaBox(tipPos, tHandle, sTitle)
         return
 
-    @pyqtSlot()
-    def _treeSelectionChange(self) -> None:
+    @pyqtSlot("QItemSelection", "QItemSelection")
+    def _treeSelectionChange(self, selected: QItemSelection, deselected: QItemSelection) -> None:
         """Extract the handle and line number of the currently selected
         title, and send it to the tree meta panel.
         """
@@ -631,8 +693,8 @@ class GuiNovelTree(QTreeWidget):
             self.novelView.selectedItemChanged.emit(tHandle)
         return
 
-    @pyqtSlot("QTreeWidgetItem*", int)
-    def _treeDoubleClick(self, item: QTreeWidgetItem, column: int) -> None:
+    @pyqtSlot("QModelIndex")
+    def _treeDoubleClick(self, index: QModelIndex) -> None:
         """Extract the handle and line number of the title double-
         clicked, and send it to the main gui class for opening in the
         document editor.
@@ -646,54 +708,110 @@ class GuiNovelTree(QTreeWidget):
     ##
 
     def _populateTree(self, rootHandle: str | None) -> None:
-        """Build the tree based on the project index."""
-        self.clearContent()
-        tStart = time()
+        """Build the tree based on the project index. Rows after the
+        first batch are added from the event loop.
+        """
         logger.debug("Building novel tree for root item '%s'", rootHandle)
 
-        novStruct = SHARED.project.index.novelStructure(rootHandle=rootHandle, activeOnly=True)
-        for tKey, tHandle, sTitle, novIdx in novStruct:
+        self._timerBuild.stop()
+        self._buildStart = time()
+        self._buildCache = {row[self.R_KEY]: row for row in self._model.rows()}
+        self._buildList = list(
+            SHARED.project.index.novelStructure(rootHandle=rootHandle, activeOnly=True)
+        )
+        self._buildPos = 0
+
+        self.setUpdatesEnabled(False)
+        if selModel := self.selectionModel():
+            selModel.blockSignals(True)
+        self._model.setRows(self._nextBatch())
+        if selModel:
+            selModel.blockSignals(False)
+        self.setUpdatesEnabled(True)
+
+        if self._buildPos < len(self._buildList):
+            self._timerBuild.start()
+        else:
+            self._finishBuild()
+
+        return
+
+    @pyqtSlot()
+    def _populateBatch(self) -> None:
+        """Append the next batch of rows to the tree."""
+        self._model.appendRows(self._nextBatch())
+        if self._buildPos < len(self._buildList):
+            self._timerBuild.start()
+        else:
+            self._finishBuild()
+        return
+
+    def _nextBatch(self) -> list[dict[tuple[int, int], Any]]:
+        """Generate the model rows for the next batch of headings."""
+        rows = []
+        end = self._buildPos + self.BATCH_SIZE
+        for tKey, tHandle, sTitle, novIdx in self._buildList[self._buildPos:end]:
             if novIdx.level == "H0":
                 continue
 
-            newItem = QTreeWidgetItem()
-            newItem.setData(self.C_DATA, self.D_HANDLE, tHandle)
-            newItem.setData(self.C_DATA, self.D_TITLE, sTitle)
-            newItem.setData(self.C_DATA, self.D_KEY, tKey)
-            newItem.setTextAlignment(self.C_WORDS, QtAlignRight)
+            if (row := self._buildCache.get(tKey)) is None:
+                row = {
+                    self.R_HANDLE: tHandle,
+                    self.R_TITLE: sTitle,
+                    self.R_KEY: tKey,
+                    self.R_WALIGN: QtAlignRight,
+                }
+
+            self._updateRowValues(row, novIdx, tHandle, sTitle)
+            rows.append(row)
 
-            self._updateTreeItemValues(newItem, novIdx, tHandle, sTitle)
-            self._treeMap[tKey] = newItem
-            self.addTopLevelItem(newItem)
+        self._buildPos = end
+        return rows
 
+    def _finishBuild(self) -> None:
+        """Restore the active handle and the selection once all rows
+        have been added.
+        """
+        self._buildList = []
+        self._buildPos = 0
+        self._buildCache = {}
         self.setActiveHandle(self._actHandle)
 
-        logger.debug("Novel Tree built in %.3f ms", (time() - tStart)*1000)
+        if (titleKey := self._selectKey) is not None:
+            self._selectKey = None
+            selModel = self.selectionModel()
+            if selModel and not selModel.hasSelection():
+                if (index := self._model.indexFromKey(titleKey)).isValid():
+                    selModel.select(
+                        index, QItemSelectionModel.SelectionFlag.ClearAndSelect
+                        | QItemSelectionModel.SelectionFlag.Rows
+                    )
+
+        logger.debug("Novel Tree built in %.3f ms", (time() - self._buildStart)*1000)
         self._lastBuild = time()
 
         return
 
-    def _updateTreeItemValues(
-        self, trItem: QTreeWidgetItem, idxItem: IndexHeading, tHandle: str, sTitle: str
+    def _updateRowValues(
+        self, row: dict[tuple[int, int], Any], idxItem: IndexHeading, tHandle: str, sTitle: str
     ) -> None:
-        """Set the tree item values from the index entry."""
+        """Set the model row values from the index entry."""
         iLevel = nwStyles.H_LEVEL.get(idxItem.level, 0)
-        hDec = SHARED.theme.getHeaderDecoration(iLevel)
 
-        trItem.setData(self.C_TITLE, QtDecoration, hDec)
-        trItem.setText(self.C_TITLE, idxItem.title)
-        trItem.setFont(self.C_TITLE, self._hFonts[iLevel])
-        trItem.setText(self.C_WORDS, f"{idxItem.wordCount:n}")
-        trItem.setData(self.C_MORE, QtDecoration, self._pMore)
+        row[self.R_HDEC] = SHARED.theme.getHeaderDecoration(iLevel)
+        row[self.R_HTEXT] = idxItem.title
+        row[self.R_HFONT] = self._hFonts[iLevel]
+        row[self.R_WORDS] = f"{idxItem.wordCount:n}"
+        row[self.R_MORE] = self._pMore
 
         # Custom column
         viewport = self.viewport()
         mW = int(self._lastColSize * (viewport.width() if viewport else 100))
         lastText, toolTip = self._getLastColumnText(tHandle, sTitle)
         elideText = self.fontMetrics().elidedText(lastText, Qt.TextElideMode.ElideRight, mW)
-        trItem.setText(self.C_EXTRA, elideText)
-        trItem.setData(self.C_DATA, self.D_EXTRA, lastText)
-        trItem.setToolTip(self.C_EXTRA, toolTip)
+        row[self.R_ETEXT] = elideText
+        row[self.R_EXTRA] = lastText
+        row[self.R_ETIP] = toolTip
 
         return
 
@@ -767,3 +885,128 @@ class GuiNovelTree(QTreeWidget):
         if tags:
             lines.append(f"<b>{trConst(nwLabels.KEY_NAME[key])}</b>: {tags}")
         return lines
+
+
+class NovelTreeModel(QAbstractTableModel):
+    """Custom: Novel Tree Model
+
+    A flat table model for the novel tree. Each row is a dictionary of
+    cell data keyed by column and role, so the view only looks up
+    values that have already been computed.
+    """
+
+    __slots__ = ("_rows", "_keys", "_active", "_brush")
+
+    def __init__(self, parent: QObject) -> None:
+        super().__init__(parent)
+        self._rows: list[dict[tuple[int, int], Any]] = []
+        self._keys: dict[str, int] = {}
+        self._active: str | None = None
+        self._brush: QBrush | None = None
+        return
+
+    ##
+    #  Methods
+    ##
+
+    def clear(self) -> None:
+        """Remove all rows from the model."""
+        self.setRows([])
+        return
+
+    def setRows(self, rows: list[dict[tuple[int, int], Any]]) -> None:
+        """Replace the content of the model."""
+        self.beginResetModel()
+        self._rows = rows
+        self._keys = {row[GuiNovelTree.R_KEY]: i for i, row in enumerate(rows)}
+        self.endResetModel()
+        return
+
+    def appendRows(self, rows: list[dict[tuple[int, int], Any]]) -> None:
+        """Append rows to the end of the model."""
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            for i, row in enumerate(rows, first):
+                self._keys[row[GuiNovelTree.R_KEY]] = i
+            self.endInsertRows()
+        return
+
+    def rows(self) -> list[dict[tuple[int, int], Any]]:
+        """Return all rows of the model."""
+        return self._rows
+
+    def row(self, key: str) -> dict[tuple[int, int], Any] | None:
+        """Return the row data for a given heading key."""
+        if (i := self._keys.get(key)) is not None:
+            return self._rows[i]
+        return None
+
+    def indexFromKey(self, key: str) -> QModelIndex:
+        """Return the model index for a given heading key."""
+        if (i := self._keys.get(key)) is not None:
+            return self.createIndex(i, 0)
+        return QModelIndex()
+
+    def refreshRows(self, keys: list[str]) -> None:
+        """Notify the view that the data of a set of rows has changed.
+        One signal is emitted per contiguous range of rows.
+        """
+        rows = sorted(i for key in keys if (i := self._keys.get(key)) is not None)
+        start = 0
+        for n in range(1, len(rows) + 1):
+            if n == len(rows) or rows[n] != rows[n-1] + 1:
+                self.dataChanged.emit(
+                    self.createIndex(rows[start], 0),
+                    self.createIndex(rows[n-1], self.columnCount() - 1)
+                )
+                start = n
+        return
+
+    def refreshColumn(self, column: int) -> None:
+        """Notify the view that the data of a column has changed."""
+        if self._rows:
+            self.dataChanged.emit(
+                self.createIndex(0, column), self.createIndex(len(self._rows) - 1, column)
+            )
+        return
+
+    def setActiveHandle(self, tHandle: str | None, brush: QBrush) -> QModelIndex:
+        """Set the handle whose rows are highlighted, and return the
+        index of its first row, if any.
+        """
+        first = QModelIndex()
+        changed = {self._active, tHandle}
+        self._active = tHandle
+        self._brush = brush
+        for i, row in enumerate(self._rows):
+            if (handle := row[GuiNovelTree.R_HANDLE]) in changed:
+                self.dataChanged.emit(
+                    self.createIndex(i, 0), self.createIndex(i, self.columnCount() - 1)
+                )
+                if handle == tHandle and not first.isValid():
+                    first = self.createIndex(i, 0)
+        return first
+
+    ##
+    #  Model Interface
+    ##
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of rows of the root."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return 4
+
+    def data(self, index: QModelIndex, role: Qt.ItemDataRole) -> Any:
+        """Return the cached data for a given cell."""
+        if index.isValid() and (i := index.row()) < len(self._rows):
+            row = self._rows[i]
+            if role == QtBackground:
+                handle = row[GuiNovelTree.R_HANDLE]
+                return self._brush if self._active and handle == self._active else None
+            return row.get((index.column(), role))
+        return None
@@ -699,6 +699,7 @@ class GuiOutlineTree(QTreeWidget):
                 headItem.setTextAlignment(
                     self._colIdx[nwOutline.PCOUNT], QtAlignRight)
 
+        items = []
         novStruct = SHARED.project.index.novelStructure(rootHandle=rootHandle, activeOnly=True)
         for _, tHandle, sTitle, novIdx in novStruct:
 
@@ -743,8 +744,9 @@ class GuiOutlineTree(QTreeWidget):
             item.setText(self._colIdx[nwOutline.STORY],   ", ".join(refs[nwKeyWords.STORY_KEY]))
             item.setText(self._colIdx[nwOutline.MENTION], ", ".join(refs[nwKeyWords.MENTION_KEY]))
 
-            self.addTopLevelItem(item)
+            items.append(item)
 
+        self.addTopLevelItems(items)
         self._lastBuild = time()
         logger.debug("Project outline built in %.3f ms", 1000.0*(time() - tStart))
 
@@ -26,6 +26,9 @@ from __future__ import annotations
 
 import re
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 from novelwriter import CONFIG
 from novelwriter.common import compact, uniqueCompact
 from novelwriter.constants import nwRegEx, nwUnicode
@@ -88,48 +91,96 @@ class RegExPatterns:
     @property
     def dialogStyle(self) -> re.Pattern | None:
         """Dialogue detection rule based on user settings."""
-        if CONFIG.dialogStyle > 0:
-            rx = []
-            if CONFIG.dialogStyle in (1, 3):
-                qO = CONFIG.fmtSQuoteOpen.strip()[:1]
-                qC = CONFIG.fmtSQuoteClose.strip()[:1]
-                if qO == qC:
-                    rx.append(f"(?:\\B{qO}.+?{qC}\\B)")
-                else:
-                    rx.append(f"(?:{qO}[^{qO}]+{qC})")
-                if CONFIG.allowOpenDial:
-                    rx.append(f"(?:{qO}.+?$)")
-            if CONFIG.dialogStyle in (2, 3):
-                qO = CONFIG.fmtDQuoteOpen.strip()[:1]
-                qC = CONFIG.fmtDQuoteClose.strip()[:1]
-                if qO == qC:
-                    rx.append(f"(?:\\B{qO}.+?{qC}\\B)")
-                else:
-                    rx.append(f"(?:{qO}[^{qO}]+{qC})")
-                if CONFIG.allowOpenDial:
-                    rx.append(f"(?:{qO}.+?$)")
-            return re.compile("|".join(rx), re.UNICODE)
-        return None
+        return self._dialogRule()[0]
+
+    @property
+    def dialogOpen(self) -> str:
+        """Symbols that open dialogue for the detection rule."""
+        return self._dialogRule()[1]
 
     @property
     def altDialogStyle(self) -> re.Pattern | None:
         """Dialogue alternative rule based on user settings."""
-        if CONFIG.altDialogOpen and CONFIG.altDialogClose:
-            qO = re.escape(compact(CONFIG.altDialogOpen))
-            qC = re.escape(compact(CONFIG.altDialogClose))
-            qB = r"\B" if (qO == qC or qC in self.AMBIGUOUS) else ""
-            return re.compile(f"{qO}.*?{qC}{qB}", re.UNICODE)
-        return None
+        return _altDialogStyle(CONFIG.altDialogOpen, CONFIG.altDialogClose)
+
+    def _dialogRule(self) -> tuple[re.Pattern | None, str]:
+        """Look up the dialogue rule for the current settings."""
+        return _dialogStyle(
+            CONFIG.dialogStyle, CONFIG.allowOpenDial,
+            CONFIG.fmtSQuoteOpen, CONFIG.fmtSQuoteClose,
+            CONFIG.fmtDQuoteOpen, CONFIG.fmtDQuoteClose,
+        )
 
 
 REGEX_PATTERNS = RegExPatterns()
 
+# Punctuation that may follow a closing narrator break
+_PUNCT_ESCAPED = re.escape(".,:;!?")
+
+
+@lru_cache(maxsize=8)
+def _dialogStyle(
+    style: int, allowOpen: bool, sqOpen: str, sqClose: str, dqOpen: str, dqClose: str
+) -> tuple[re.Pattern | None, str]:
+    """Build the dialogue detection RegEx and the symbols that open it.
+    The result is cached per combination of settings.
+    """
+    if style > 0:
+        rx = []
+        symbols = ""
+        if style in (1, 3):
+            qO = sqOpen.strip()[:1]
+            qC = sqClose.strip()[:1]
+            symbols += qO
+            if qO == qC:
+                rx.append(f"(?:\\B{qO}.+?{qC}\\B)")
+            else:
+                rx.append(f"(?:{qO}[^{qO}]+{qC})")
+            if allowOpen:
+                rx.append(f"(?:{qO}.+?$)")
+        if style in (2, 3):
+            qO = dqOpen.strip()[:1]
+            qC = dqClose.strip()[:1]
+            symbols += qO
+            if qO == qC:
+                rx.append(f"(?:\\B{qO}.+?{qC}\\B)")
+            else:
+                rx.append(f"(?:{qO}[^{qO}]+{qC})")
+            if allowOpen:
+                rx.append(f"(?:{qO}.+?$)")
+        return re.compile("|".join(rx), re.UNICODE), symbols
+    return None, ""
+
+
+@lru_cache(maxsize=8)
+def _altDialogStyle(altOpen: str, altClose: str) -> re.Pattern | None:
+    """Build the alternative dialogue RegEx. The result is cached per
+    combination of settings.
+    """
+    if altOpen and altClose:
+        qO = re.escape(compact(altOpen))
+        qC = re.escape(compact(altClose))
+        qB = r"\B" if (qO == qC or qC in RegExPatterns.AMBIGUOUS) else ""
+        return re.compile(f"{qO}.*?{qC}{qB}", re.UNICODE)
+    return None
+
+
+@lru_cache(maxsize=8)
+def _narratorBreaks(narrator: str) -> tuple[re.Pattern, re.Pattern]:
+    """Build the narrator break RegExes for dialogue lines and quoted
+    dialogue, respectively. The result is cached per narrator symbol.
+    """
+    return (
+        re.compile(f"{narrator}.*?(?:{narrator}[{_PUNCT_ESCAPED}]?|$)", re.UNICODE),
+        re.compile(f"{narrator}.*?(?:{narrator}[{_PUNCT_ESCAPED}]?)", re.UNICODE),
+    )
+
 
 class DialogParser:
 
     __slots__ = (
         "_quotes", "_dialog", "_alternate", "_enabled",
-        "_narrator", "_breakD", "_breakQ", "_mode",
+        "_narrator", "_breakD", "_breakQ", "_mode", "_symbols",
     )
 
     def __init__(self) -> None:
@@ -141,6 +192,7 @@ class DialogParser:
         self._breakD = None
         self._breakQ = None
         self._mode = ""
+        self._symbols = ""
         return
 
     @property
@@ -160,62 +212,72 @@ class DialogParser:
         # anything to do
         self._enabled = bool(self._quotes or self._dialog or self._alternate)
 
+        # Symbols that can open dialogue anywhere in the text. If none
+        # of them are present, only the dialogue line rule can match
+        self._symbols = uniqueCompact(self._alternate + REGEX_PATTERNS.dialogOpen)
+
         # Build narrator break RegExes
         if narrator := CONFIG.narratorBreak.strip()[:1]:
-            punct = re.escape(".,:;!?")
-            self._breakD = re.compile(f"{narrator}.*?(?:{narrator}[{punct}]?|$)", re.UNICODE)
-            self._breakQ = re.compile(f"{narrator}.*?(?:{narrator}[{punct}]?)", re.UNICODE)
+            self._breakD, self._breakQ = _narratorBreaks(narrator)
             self._narrator = narrator
             self._mode = f" {narrator}"
+        else:
+            self._breakD = None
+            self._breakQ = None
+            self._narrator = ""
+            self._mode = ""
 
         return
 
     def __call__(self, text: str) -> list[tuple[int, int]]:
         """Caller wrapper for dialogue processing."""
-        temp: list[int] = []
         result: list[tuple[int, int]] = []
-        if text:
+        if text and (text[0] in self._dialog or any(c in text for c in self._symbols)):
             plain = True
             if self._dialog and text[0] in self._dialog:
                 # The whole line is dialogue
                 plain = False
-                temp.append(0)
-                temp.append(len(text))
-                if self._breakD:
-                    # Process narrator breaks in the dialogue
-                    for res in self._breakD.finditer(text, 1):
-                        temp.append(res.start(0))
-                        temp.append(res.end(0))
+                breaks = self._breakD.finditer(text, 1) if self._breakD else ()
+                self._addSpan(result, 0, len(text), breaks)
             elif self._quotes:
                 # Quoted dialogue is enabled, so we look for them
                 for res in self._quotes.finditer(text):
                     plain = False
-                    temp.append(res.start(0))
-                    temp.append(res.end(0))
-                    if self._breakQ:
-                        for sub in self._breakQ.finditer(text, res.start(0), res.end(0)):
-                            temp.append(sub.start(0))
-                            temp.append(sub.end(0))
+                    qS, qE = res.span(0)
+                    breaks = self._breakQ.finditer(text, qS, qE) if self._breakQ else ()
+                    self._addSpan(result, qS, qE, breaks)
 
             if plain and self._alternate:
                 # The main rules found no dialogue, so we check for
                 # alternating dialogue sections, if enabled
-                pos = 0
-                for num, bit in enumerate(text.split(self._alternate)):
-                    length = len(bit) + (1 if num > 0 else 0)
-                    if num%2:
-                        temp.append(pos)
-                        temp.append(pos + length)
-                    pos += length
-
-            if temp:
-                # Sort unique edges in increasing order, and add them in pairs
-                start = None
-                for pos in sorted(set(temp)):
-                    if start is None:
-                        start = pos
-                    else:
-                        result.append((start, pos))
-                        start = None
+                alt = self._alternate
+                start = text.find(alt)
+                while start >= 0:
+                    end = text.find(alt, start + 1)
+                    if end < 0:
+                        result.append((start, len(text)))
+                        break
+                    result.append((start, end))
+                    start = text.find(alt, end + 1)
 
         return result
+
+    ##
+    #  Internal Functions
+    ##
+
+    @staticmethod
+    def _addSpan(
+        result: list[tuple[int, int]], start: int, end: int, breaks: Iterable[re.Match]
+    ) -> None:
+        """Add a dialogue span to the result, with the narrator breaks
+        cut out of it. The breaks are in increasing order and inside
+        the span, so the parts can be added directly.
+        """
+        for res in breaks:
+            if res.start(0) > start:
+                result.append((start, res.start(0)))
+            start = res.end(0)
+        if end > start:
+            result.append((start, end))
+        return
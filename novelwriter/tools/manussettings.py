@@ -25,10 +25,14 @@ from __future__ import annotations
 
 import logging
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QEvent, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QFont, QIcon, QSyntaxHighlighter, QTextCharFormat, QTextDocument
+from PyQt6.QtGui import (
+    QFont, QIcon, QShowEvent, QSyntaxHighlighter, QTextCharFormat,
+    QTextDocument
+)
 from PyQt6.QtWidgets import (
     QAbstractButton, QAbstractItemView, QDialogButtonBox, QFrame, QGridLayout,
     QHBoxLayout, QLabel, QLineEdit, QMenu, QPlainTextEdit, QPushButton,
@@ -50,9 +54,8 @@ from novelwriter.extensions.pagedsidebar import NPagedSideBar
 from novelwriter.extensions.switch import NSwitch
 from novelwriter.extensions.switchbox import NSwitchBox
 from novelwriter.types import (
-    QtAlignCenter, QtAlignLeft, QtDialogApply, QtDialogClose, QtDialogSave,
-    QtHeaderFixed, QtHeaderStretch, QtRoleAccept, QtRoleApply, QtRoleReject,
-    QtUserRole
+    QtAlignCenter, QtDialogApply, QtDialogClose, QtDialogSave, QtHeaderFixed,
+    QtHeaderStretch, QtRoleAccept, QtRoleApply, QtRoleReject, QtUserRole
 )
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -81,6 +84,8 @@ class GuiBuildSettings(NToolDialog):
         self.setObjectName("GuiBuildSettings")
 
         self._build = build
+        self._loaded = False
+        self._optTabHeadings: _HeadingsTab | None = None
 
         self.setWindowTitle(self.tr("Manuscript Build Settings"))
         self.setMinimumSize(700, 400)
@@ -113,13 +118,12 @@ class GuiBuildSettings(NToolDialog):
         self.sidebar.buttonClicked.connect(self._stackPageSelected)
 
         # Content
+        # The headings tab is created when first used, see optTabHeadings
         self.optTabSelect = _FilterTab(self, self._build)
-        self.optTabHeadings = _HeadingsTab(self, self._build)
         self.optTabFormatting = _FormattingTab(self, self._build, self.sidebar)
 
         self.toolStack = QStackedWidget(self)
         self.toolStack.addWidget(self.optTabSelect)
-        self.toolStack.addWidget(self.optTabHeadings)
         self.toolStack.addWidget(self.optTabFormatting)
 
         # Buttons
@@ -161,8 +165,10 @@ class GuiBuildSettings(NToolDialog):
         """Populate the child widgets."""
         self.editBuildName.setText(self._build.name)
         self.optTabSelect.loadContent()
-        self.optTabHeadings.loadContent()
+        if self._optTabHeadings:
+            self._optTabHeadings.loadContent()
         self.optTabFormatting.loadContent()
+        self._loaded = True
         return
 
     ##
@@ -174,6 +180,16 @@ class GuiBuildSettings(NToolDialog):
         """The build ID of the build of the dialog."""
         return self._build.buildID
 
+    @property
+    def optTabHeadings(self) -> _HeadingsTab:
+        """The headings tab, which is created on first use."""
+        if self._optTabHeadings is None:
+            self._optTabHeadings = _HeadingsTab(self, self._build)
+            self.toolStack.addWidget(self._optTabHeadings)
+            if self._loaded:
+                self._optTabHeadings.loadContent()
+        return self._optTabHeadings
+
     ##
     #  Events
     ##
@@ -251,7 +267,8 @@ class GuiBuildSettings(NToolDialog):
     def _emitBuildData(self) -> None:
         """Assemble the build data and emit the signal."""
         self._build.setName(self.editBuildName.text())
-        self.optTabHeadings.saveContent()
+        if self._optTabHeadings:
+            self._optTabHeadings.saveContent()
         self.optTabFormatting.saveContent()
         self.newSettingsReady.emit(self._build)
         self._build.resetChangedState()
@@ -266,7 +283,6 @@ class _FilterTab(NFixedPage):
     C_STATUS = 2
 
     D_HANDLE = QtUserRole
-    D_FILE   = QtUserRole + 1
 
     F_NONE     = 0
     F_FILTERED = 1
@@ -277,14 +293,18 @@ class _FilterTab(NFixedPage):
         super().__init__(parent=parent)
 
         self._treeMap: dict[str, QTreeWidgetItem] = {}
+        self._treeFiles: set[str] = set()
+        self._treePending = False
+        self._mainIcons: dict[tuple, QIcon] = {}
         self._build = build
 
-        self._statusFlags: dict[int, QIcon] = {
-            self.F_NONE:     QIcon(),
-            self.F_FILTERED: SHARED.theme.getIcon("filter", "orange"),
-            self.F_INCLUDED: SHARED.theme.getIcon("pin", "blue"),
-            self.F_EXCLUDED: SHARED.theme.getIcon("exclude", "red"),
-        }
+        # Indexed by the F_* flag values
+        self._statusFlags: list[QIcon] = [
+            QIcon(),                                   # F_NONE
+            SHARED.theme.getIcon("filter", "orange"),  # F_FILTERED
+            SHARED.theme.getIcon("pin", "blue"),       # F_INCLUDED
+            SHARED.theme.getIcon("exclude", "red"),    # F_EXCLUDED
+        ]
 
         self._trIncluded = self.tr("Included in manuscript")
         self._trExcluded = self.tr("Excluded from manuscript")
@@ -388,6 +408,17 @@ class _FilterTab(NFixedPage):
         m, n = (sizes[0], sizes[1]) if len(sizes) >= 2 else (0, 0)
         return m, n
 
+    ##
+    #  Events
+    ##
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Build the tree if it was deferred while hidden."""
+        super().showEvent(event)
+        if self._treePending:
+            self._populateTree()
+        return
+
     ##
     #  Slots
     ##
@@ -408,10 +439,31 @@ class _FilterTab(NFixedPage):
     ##
 
     def _populateTree(self) -> None:
-        """Build the tree of project items."""
+        """Build the tree of project items. If the tab is not visible,
+        the build is deferred until it is shown.
+        """
+        self._mainIcons = {}
+        if not self.isVisible():
+            self._treePending = True
+            return
+
         logger.debug("Building project tree")
-        self._treeMap = {}
+        self._treePending = False
+        self.optTree.setUpdatesEnabled(False)
+        self.optTree.blockSignals(True)
+
+        self._treeMap = treeMap = {}
+        self._treeFiles = treeFiles = set()
         self.optTree.clear()
+
+        # Bind the names used for every item
+        cName, cActive, cData = self.C_NAME, self.C_ACTIVE, self.C_DATA
+        dHandle = self.D_HANDLE
+        isRootAllowed = self._build.isRootAllowed
+
+        roots: list[QTreeWidgetItem] = []
+        mainIcons = self._mainIcons
+        activeIcons: dict[tuple[bool, bool], QIcon] = {}
         for nwItem in SHARED.project.tree:
             tHandle = nwItem.itemHandle
             pHandle = nwItem.itemParent
@@ -421,30 +473,45 @@ class _FilterTab(NFixedPage):
                 continue
 
             isFile = nwItem.isFileType()
-            if nwItem.isInactiveClass() or not self._build.isRootAllowed(rHandle):
+            if nwItem.isInactiveClass() or not isRootAllowed(rHandle):
                 continue
 
+            iconKey = (
+                nwItem.itemType, nwItem.itemClass, nwItem.itemLayout, nwItem.mainHeading
+            )
+            if (mainIcon := mainIcons.get(iconKey)) is None:
+                mainIcon = mainIcons[iconKey] = nwItem.getMainIcon()
+
+            activeKey = (isFile, nwItem.isActive)
+            if (activeIcon := activeIcons.get(activeKey)) is None:
+                activeIcon = activeIcons[activeKey] = nwItem.getActiveStatus()[1]
+
             trItem = QTreeWidgetItem()
-            trItem.setIcon(self.C_NAME, nwItem.getMainIcon())
-            trItem.setText(self.C_NAME, nwItem.itemName)
-            trItem.setData(self.C_DATA, self.D_HANDLE, tHandle)
-            trItem.setData(self.C_DATA, self.D_FILE, isFile)
-            trItem.setIcon(self.C_ACTIVE, nwItem.getActiveStatus()[1])
-            trItem.setTextAlignment(self.C_NAME, QtAlignLeft)
+            trItem.setIcon(cName, mainIcon)
+            trItem.setText(cName, nwItem.itemName)
+            trItem.setData(cData, dHandle, tHandle)
+            trItem.setIcon(cActive, activeIcon)
 
             if pHandle is None and nwItem.isRootType():
-                self.optTree.addTopLevelItem(trItem)
-            elif pHandle in self._treeMap:
-                self._treeMap[pHandle].addChild(trItem)
+                roots.append(trItem)
+            elif (parent := treeMap.get(pHandle)) is not None:
+                parent.addChild(trItem)
             else:
                 logger.debug("Skipping item '%s'", tHandle)
                 continue
 
-            self._treeMap[tHandle] = trItem
-            trItem.setExpanded(True)
+            treeMap[tHandle] = trItem
+            if isFile:
+                treeFiles.add(tHandle)
 
+        # The items are built off-tree and attached in one call
+        self.optTree.addTopLevelItems(roots)
+        self.optTree.expandAll()
         self._setTreeItemMode()
 
+        self.optTree.blockSignals(False)
+        self.optTree.setUpdatesEnabled(True)
+
         return
 
     def _populateFilters(self) -> None:
@@ -474,10 +541,16 @@ class _FilterTab(NFixedPage):
 
         # Root Classes
         self.filterOpt.addLabel(self.tr("Select Root Folders"))
+        mainIcons = self._mainIcons
         for tHandle, nwItem in SHARED.project.tree.iterRoots(None):
             if not nwItem.isInactiveClass():
+                iconKey = (
+                    nwItem.itemType, nwItem.itemClass, nwItem.itemLayout, nwItem.mainHeading
+                )
+                if (mainIcon := mainIcons.get(iconKey)) is None:
+                    mainIcon = mainIcons[iconKey] = nwItem.getMainIcon()
                 self.filterOpt.addItem(
-                    nwItem.getMainIcon(), nwItem.itemName, f"root:{tHandle}",
+                    mainIcon, nwItem.itemName, f"root:{tHandle}",
                     default=self._build.isRootAllowed(tHandle)
                 )
 
@@ -485,31 +558,40 @@ class _FilterTab(NFixedPage):
 
     def _setSelectedMode(self, mode: int) -> None:
         """Set the mode for the selected items."""
+        setters = {
+            self.F_FILTERED: self._build.setFiltered,
+            self.F_INCLUDED: self._build.setIncluded,
+            self.F_EXCLUDED: self._build.setExcluded,
+        }
+        if (setMode := setters.get(mode)) is None:
+            return
+
         items = self.optTree.selectedItems()
-        if len(items) == 1 and isinstance(items[0], QTreeWidgetItem):
+        if len(items) == 1:
             items = self._scanChildren(items[0], [])
 
+        changed = []
         for item in items:
-            if isinstance(item, QTreeWidgetItem):
-                tHandle = item.data(self.C_DATA, self.D_HANDLE)
-                isFile = item.data(self.C_DATA, self.D_FILE)
-                if isFile:
-                    if mode == self.F_FILTERED:
-                        self._build.setFiltered(tHandle)
-                    elif mode == self.F_INCLUDED:
-                        self._build.setIncluded(tHandle)
-                    elif mode == self.F_EXCLUDED:
-                        self._build.setExcluded(tHandle)
+            tHandle = item.data(self.C_DATA, self.D_HANDLE)
+            if tHandle in self._treeFiles:
+                setMode(tHandle)
+                changed.append(tHandle)
 
-        self._setTreeItemMode()
+        self._setTreeItemMode(changed)
 
         return
 
-    def _setTreeItemMode(self) -> None:
-        """Update the filtered mode icon on all items."""
-        filtered = self._build.buildItemFilter(SHARED.project)
-        for tHandle, item in self._treeMap.items():
-            allow, mode = filtered.get(tHandle, (False, FilterMode.UNKNOWN))
+    def _setTreeItemMode(self, handles: Iterable[str] | None = None) -> None:
+        """Update the filtered mode icon on all items, or only on the
+        items of the given handles.
+        """
+        if handles is None:
+            filtered = self._build.buildItemFilter(SHARED.project)
+        else:
+            filtered = self._build.filterItems(SHARED.project, handles)
+        for tHandle, (allow, mode) in filtered.items():
+            if (item := self._treeMap.get(tHandle)) is None:
+                continue
             if mode == FilterMode.INCLUDED:
                 item.setIcon(self.C_STATUS, self._statusFlags[self.F_INCLUDED])
                 item.setToolTip(self.C_STATUS, self._trIncluded)
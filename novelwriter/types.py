@@ -74,7 +74,12 @@ QtHexArgb = QColor.NameFormat.HexArgb
 
 # Qt Tree and Table Types
 
+QtBackground = Qt.ItemDataRole.BackgroundRole
 QtDecoration = Qt.ItemDataRole.DecorationRole
+QtDisplay = Qt.ItemDataRole.DisplayRole
+QtFontRole = Qt.ItemDataRole.FontRole
+QtTextAlignment = Qt.ItemDataRole.TextAlignmentRole
+QtToolTip = Qt.ItemDataRole.ToolTipRole
 QtUserRole = Qt.ItemDataRole.UserRole
 
 # Keyboard and Mouse Buttons
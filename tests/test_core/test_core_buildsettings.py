@@ -247,6 +247,13 @@ def testCoreBuildSettings_Filters(mockGUI, fncPath: Path, mockRnd):
         hCharDoc:      (False, FilterMode.FILTERED),
     }
 
+    # Filter a subset of items
+    assert build.filterItems(project, [C.hSceneDoc, C.hChapterDir, hPlotDoc, C.hInvalid]) == {
+        C.hSceneDoc:   (True,  FilterMode.FILTERED),
+        C.hChapterDir: (False, FilterMode.SKIPPED),
+        hPlotDoc:      (False, FilterMode.FILTERED),
+    }
+
     # Enable notes and roots
     build.setValue("filter.includeNotes", True)
     assert build.buildItemFilter(project, withRoots=True) == {
@@ -359,6 +366,7 @@ def testCoreBuildSettings_Filters(mockGUI, fncPath: Path, mockRnd):
 
     # No valid project provided
     assert build.buildItemFilter(None) == {}  # type: ignore
+    assert build.filterItems(None, [C.hSceneDoc]) == {}  # type: ignore
 
 
 @pytest.mark.core
@@ -730,6 +730,10 @@ def testCoreIndex_ExtractData(mockGUI, fncPath, mockRnd):
     assert refs["@pov"] == ["Jane"]
     assert refs["@char"] == ["Jane", "John"]
 
+    # Look up a single section, and an invalid section
+    assert index.getReferences(nHandle, "T0001")["@char"] == ["Jane", "John"]
+    assert index.getReferences(nHandle, "T0099")["@char"] == []
+
     # getReferenceForHeader
     # =====================
     assert index.getReferenceForHeader(nHandle, 1, "@pov") == ["Jane"]
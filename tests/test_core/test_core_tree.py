@@ -242,6 +242,8 @@ def testCoreTree_ItemMethods(monkeypatch, mockGUI, mockItems):
 
     # Item Path
     assert tree.itemPath(C.hSceneDoc, asName=True) == ["New Scene", "New Folder", "Novel"]
+    assert tree.itemPath(C.hSceneDoc) == [C.hSceneDoc, C.hChapterDir, C.hNovelRoot]
+    assert tree.itemPath(C.hInvalid) == []
     with monkeypatch.context() as mp:
         mp.setattr("novelwriter.core.tree.MAX_DEPTH", 1)
         assert tree.itemPath(C.hSceneDoc, asName=True) == ["New Scene"]
@@ -317,7 +319,10 @@ def testCoreTree_OtherMethods(qtbot, monkeypatch, mockGUI, fncPath, mockRnd):
     assert tree._getTrashNode() is trash
     tree._trash = None
     assert tree._getTrashNode() is trash
+    assert tree.trash is trash
+    assert tree._trash is trash
     tree.remove(trash.item.itemHandle)
+    assert tree._trash is None
 
     with monkeypatch.context() as mp:
         mp.setattr("novelwriter.core.tree.NWTree.create", lambda *a, **k: None)
@@ -414,17 +419,11 @@ def testCoreTree_ToCFile(monkeypatch, fncPath, mockGUI, mockItems):
     tree = NWTree(project)
     tree.unpack(mockItems)
 
-    def mockIsFile(fileName):
-        """Return True for items that are files in novelWriter and
-        should thus also be files in the project folder structure.
-        """
-        dItem = tree[fileName.name[:13]]
-        assert dItem is not None
-        return dItem.itemType == nwItemType.FILE
-
-    monkeypatch.setattr("pathlib.Path.is_file", mockIsFile)
+    # The content folder is populated by the mockItems fixture
     project._storage._runtimePath = fncPath
-    # (fncPath / "content").mkdir()
+    assert sorted(project.storage.scanContent()) == [
+        "000000000000c", "000000000000e", "000000000000f",
+    ]
 
     # Block extraction of the path
     with monkeypatch.context() as mp:
@@ -449,3 +448,16 @@ def testCoreTree_ToCFile(monkeypatch, fncPath, mockGUI, mockItems):
         "content/000000000000e.nwd  NOVEL      DOCUMENT  New Chapter\n"
         "content/000000000000f.nwd  NOVEL      DOCUMENT  New Scene\n"
     )
+
+    # With no content files, only the header is written
+    for path in (fncPath / "content").iterdir():
+        path.unlink()
+    assert tree.writeToCFile() is True
+    assert (fncPath / nwFiles.TOC_TXT).read_text() == (
+        "\n"
+        "Table of Contents\n"
+        "=================\n"
+        "\n"
+        "File Name                  Class      Layout    Document Label\n"
+        "--------------------------------------------------------------\n"
+    )
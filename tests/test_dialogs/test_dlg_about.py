@@ -27,8 +27,8 @@ import pytest
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import QMessageBox
 
-from novelwriter import SHARED
-from novelwriter.dialogs.about import GuiAbout
+from novelwriter import CONFIG, SHARED
+from novelwriter.dialogs.about import _HTML_CACHE, GuiAbout
 
 
 @pytest.mark.gui
@@ -44,6 +44,7 @@ def testDlgAbout_NWDialog(qtbot, monkeypatch, nwGUI):
     document = msgAbout.txtCredits.document()
     assert document is not None
     assert document.characterCount() > 100
+    assert CONFIG.assetPath("text") / "credits_en.htm" in _HTML_CACHE
 
     with monkeypatch.context() as mp:
         mp.setattr("novelwriter.config.Config.assetPath", lambda *a: Path("whatever"))
@@ -155,8 +155,8 @@ def testGuiMain_ProjectTreeItems(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
     with monkeypatch.context() as mp:
         mp.setattr(GuiNovelView, "treeHasFocus", lambda *a: True)
         assert nwGUI.docEditor.docHandle is None
-        selItem = nwGUI.novelView.novelTree.topLevelItem(2)
-        nwGUI.novelView.novelTree.setCurrentItem(selItem)
+        novelTree = nwGUI.novelView.novelTree
+        novelTree.setCurrentIndex(novelTree.model().index(2, 0))
         nwGUI._keyPressReturn()
         assert nwGUI.docEditor.docHandle == sHandle
         nwGUI.closeDocument()
@@ -24,15 +24,15 @@ from pathlib import Path
 
 import pytest
 
-from PyQt6.QtCore import QEvent, QPoint, Qt
+from PyQt6.QtCore import QEvent, QItemSelectionModel, QPoint, Qt
 from PyQt6.QtGui import QFocusEvent
 from PyQt6.QtWidgets import QInputDialog, QToolTip
 
 from novelwriter import CONFIG, SHARED
 from novelwriter.dialogs.editlabel import GuiEditLabel
-from novelwriter.enum import nwFocus, nwItemType
+from novelwriter.enum import nwFocus, nwItemClass, nwItemType
 from novelwriter.gui.noveltree import GuiNovelTree, NovelTreeColumn
-from novelwriter.types import QtMouseLeft, QtMouseMiddle
+from novelwriter.types import QtBackground, QtMouseLeft, QtMouseMiddle
 
 from tests.tools import C, buildTestProject
 
@@ -89,57 +89,125 @@ def testGuiNovelTree_TreeItems(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
     nwGUI.projStack.setCurrentWidget(nwGUI.novelView)
     nwGUI.rebuildIndex()
     novelTree._populateTree(rootHandle=None)
-    assert novelTree.topLevelItemCount() == 3
+    novelModel = novelTree.model()
+    selModel = novelTree.selectionModel()
+    assert novelModel.rowCount() == 3
+    assert novelModel.columnCount() == 4
 
     # Rebuild should preserve selection
-    topItem = novelTree.topLevelItem(0)
-    assert not topItem.isSelected()
-    topItem.setSelected(True)
-    assert novelTree.selectedItems()[0] == topItem
+    topIndex = novelModel.index(0, 0)
+    topRow = novelModel.row(topIndex.data(novelTree.D_KEY))
+    assert not selModel.isSelected(topIndex)
+    novelTree.setCurrentIndex(topIndex)
+    assert novelTree.selectedIndexes()[0] == topIndex
     assert novelView.getSelectedHandle() == (C.hTitlePage, "T0001")
 
-    # Refresh using the slot for the button
+    # Refresh using the slot for the button, which reuses the rows
     novelBar._refreshNovelTree()
-    assert novelTree.topLevelItem(0).isSelected()
+    assert novelModel.rows()[0] is topRow
+    assert selModel.isSelected(novelModel.index(0, 0))
 
     # Open Items
     # ==========
 
     # Clear selection
     novelTree.clearSelection()
-    scItem = novelTree.topLevelItem(2)
-    scItem.setSelected(True)
-    assert scItem.isSelected()
+    scIndex = novelModel.index(2, 0)
+    novelTree.setCurrentIndex(scIndex)
+    assert selModel.isSelected(scIndex)
 
     # Clear selection with mouse
     vPort = novelTree.viewport()
     qtbot.mouseClick(vPort, QtMouseLeft, pos=vPort.rect().center(), delay=10)
-    assert not scItem.isSelected()
+    assert not selModel.isSelected(scIndex)
 
     # Double-click item
-    scItem.setSelected(True)
-    assert scItem.isSelected()
+    novelTree.setCurrentIndex(scIndex)
+    assert selModel.isSelected(scIndex)
     assert nwGUI.docEditor.docHandle is None
-    novelTree._treeDoubleClick(scItem, 0)
+    novelTree._treeDoubleClick(scIndex)
     assert nwGUI.docEditor.docHandle == C.hSceneDoc
 
     # Open item with middle mouse button
-    scItem.setSelected(True)
-    assert scItem.isSelected()
+    novelTree.setCurrentIndex(scIndex)
+    assert selModel.isSelected(scIndex)
     assert nwGUI.docViewer.docHandle is None
     qtbot.mouseClick(vPort, QtMouseMiddle, pos=vPort.rect().center(), delay=10)
     assert nwGUI.docViewer.docHandle is None
 
-    scRect = novelTree.visualItemRect(scItem)
-    oldData = scItem.data(novelTree.C_TITLE, novelTree.D_HANDLE)
-    scItem.setData(novelTree.C_TITLE, novelTree.D_HANDLE, None)
+    scRect = novelTree.visualRect(scIndex)
+    scRow = novelModel.rows()[2]
+    oldData = scRow[novelTree.R_HANDLE]
+    scRow[novelTree.R_HANDLE] = None
     qtbot.mouseClick(vPort, QtMouseMiddle, pos=scRect.center(), delay=10)
     assert nwGUI.docViewer.docHandle is None
 
-    scItem.setData(novelTree.C_TITLE, novelTree.D_HANDLE, oldData)
+    scRow[novelTree.R_HANDLE] = oldData
     qtbot.mouseClick(vPort, QtMouseMiddle, pos=scRect.center(), delay=10)
     assert nwGUI.docViewer.docHandle == C.hSceneDoc
 
+    # Batched Build
+    # =============
+
+    novelTree.setCurrentIndex(scIndex)
+    with monkeypatch.context() as mp:
+        mp.setattr(GuiNovelTree, "BATCH_SIZE", 1)
+        novelTree.refreshTree()
+        assert novelModel.rowCount() == 1
+        qtbot.waitUntil(lambda: novelModel.rowCount() == 3, timeout=1000)
+        assert selModel.isSelected(novelModel.index(2, 0))
+
+    # Deferred Refresh
+    # ================
+
+    novelTree.hide()
+    novelTree.clearContent()
+    novelTree.refreshTree()
+    assert novelModel.rowCount() == 0
+    novelTree.show()
+    assert novelModel.rowCount() == 3
+
+    # Active Handle
+    # =============
+
+    novelTree.setActiveHandle(C.hSceneDoc)
+    assert scIndex.data(QtBackground) == novelTree.palette().alternateBase()
+    assert topIndex.data(QtBackground) is None
+    novelTree.setActiveHandle(None)
+    assert scIndex.data(QtBackground) is None
+
+    # Refresh Rows
+    # ============
+
+    changed = []
+
+    def dataChanged(topLeft, bottomRight, roles):
+        changed.append((topLeft.row(), bottomRight.row()))
+
+    keys = [novelModel.index(i, 0).data(novelTree.D_KEY) for i in range(3)]
+    novelModel.dataChanged.connect(dataChanged)
+    novelTree.refreshHandle(C.hSceneDoc)
+    assert changed == []
+
+    SHARED.project.index.scanText(C.hSceneDoc, (
+        "### Scene Two\n\n"
+        "@pov: Jane\n"
+        "@focus: Jane\n\n"
+        "% Synopsis: This is a scene."
+    ), blockSignal=True)
+    novelTree.refreshHandle(C.hSceneDoc)
+    assert changed == [(2, 2)]
+    assert scIndex.siblingAtColumn(novelTree.C_TITLE).data() == "Scene Two"
+
+    changed.clear()
+    novelModel.refreshRows([keys[2], keys[0], keys[1], "invalid"])
+    assert changed == [(0, 2)]
+
+    changed.clear()
+    novelModel.refreshRows([keys[0], keys[2]])
+    assert changed == [(0, 0), (2, 2)]
+    novelModel.dataChanged.disconnect(dataChanged)
+
     # Last Column
     # ===========
 
@@ -222,14 +290,82 @@ def testGuiNovelTree_TreeItems(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
     # Other Checks
     # ============
 
-    scItem = novelTree.topLevelItem(2)
-    scItem.setSelected(True)
-    assert scItem.isSelected()
+    novelTree.setCurrentIndex(scIndex)
+    assert selModel.isSelected(scIndex)
     novelTree.focusOutEvent(QFocusEvent(QEvent.Type.None_, Qt.FocusReason.MouseFocusReason))
-    assert not scItem.isSelected()
+    assert not selModel.isSelected(scIndex)
 
     # Close
     # =====
 
     # qtbot.stop()
     nwGUI.closeProject()
+
+
+@pytest.mark.gui
+def testGuiNovelTree_RefreshHandle(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
+    """Test that refreshing a handle keeps the selected novel root."""
+    buildTestProject(nwGUI, projPath)
+
+    project = SHARED.project
+    nRoot = project.newRoot(nwItemClass.NOVEL)
+    nDoc = project.newFile("Novel Two", nRoot)
+    assert nDoc is not None
+    project.index.scanText(nDoc, "## Chapter Two\n\n### Scene Two\n\n", blockSignal=True)
+
+    novelView = nwGUI.novelView
+    novelTree = novelView.novelTree
+    novelModel = novelTree.model()
+
+    def rowHandles():
+        return [
+            novelModel.index(i, 0).data(novelTree.D_HANDLE) for i in range(novelModel.rowCount())
+        ]
+
+    # Refresh While Hidden
+    # ====================
+
+    nwGUI.projStack.setCurrentWidget(nwGUI.projView)
+    novelTree.refreshTree(rootHandle=nRoot)
+    assert novelTree._dirty is True
+
+    novelView.updateNovelItemMeta(nDoc)
+    assert project.data.getLastHandle("novelTree") == nRoot
+
+    nwGUI.projStack.setCurrentWidget(nwGUI.novelView)
+    assert novelTree._dirty is False
+    assert rowHandles() == [nDoc, nDoc]
+
+    # Refresh During Batched Build
+    # ============================
+
+    selModel = novelTree.selectionModel()
+    novelTree.setCurrentIndex(novelModel.index(1, 0))
+    with monkeypatch.context() as mp:
+        mp.setattr(GuiNovelTree, "BATCH_SIZE", 1)
+        novelTree.refreshTree(rootHandle=nRoot)
+        assert novelModel.rowCount() == 1
+        assert novelTree._buildPos == 1
+
+        # The second heading has not been added yet, so its pending
+        # entry is updated and the build continues
+        project.index.scanText(nDoc, "## Chapter Two\n\n### Scene Three\n\n", blockSignal=True)
+        mp.setattr(novelTree, "refreshTree", lambda *a, **k: pytest.fail("Build restarted"))
+        novelTree.refreshHandle(nDoc)
+        assert project.data.getLastHandle("novelTree") == nRoot
+        assert novelTree._buildPos == 1
+        assert novelTree._buildList[1][3].title == "Scene Three"
+
+        # A selection made during the build is kept
+        selModel.select(novelModel.index(0, 0), QItemSelectionModel.SelectionFlag.Select)
+        qtbot.waitUntil(lambda: novelModel.rowCount() == 2, timeout=1000)
+        assert novelTree._buildList == []
+
+    assert rowHandles() == [nDoc, nDoc]
+    assert novelModel.index(1, novelTree.C_TITLE).data() == "Scene Three"
+    assert selModel.isSelected(novelModel.index(0, 0))
+    assert not selModel.isSelected(novelModel.index(1, 0))
+    assert project.data.getLastHandle("novelTree") == nRoot
+
+    # qtbot.stop()
+    nwGUI.closeProject()
@@ -270,6 +270,7 @@ def testTextPatterns_DialogueStyle():
     # Before set, the regex is None
     CONFIG.dialogStyle = 0
     assert REGEX_PATTERNS.dialogStyle is None
+    assert REGEX_PATTERNS.dialogOpen == ""
 
     # Set the config
     CONFIG.fmtSQuoteOpen  = nwUnicode.U_LSQUO
@@ -285,6 +286,7 @@ def testTextPatterns_DialogueStyle():
     CONFIG.allowOpenDial = False
     regEx = REGEX_PATTERNS.dialogStyle
     assert regEx is not None
+    assert REGEX_PATTERNS.dialogOpen == nwUnicode.U_LSQUO + nwUnicode.U_LDQUO
 
     # Defined single quotes are recognised
     assert allMatches(regEx, "one \u2018two\u2019 three") == [
@@ -450,6 +452,7 @@ def testTextPatterns_DialogParserEnglish():
     parser = DialogParser()
     parser.initParser()
     assert parser.enabled is True
+    assert parser._symbols == nwUnicode.U_LSQUO + nwUnicode.U_LDQUO
 
     # Positions:   0                 18
     assert parser("“Simple dialogue.”") == [
@@ -466,6 +469,17 @@ def testTextPatterns_DialogParserEnglish():
         (0, 18), (32, 56),
     ]
 
+    # Adjacent quoted spans are both dialogue
+    # Positions:   0  3  6
+    assert parser("‘a’‘b’") == [
+        (0, 3), (3, 6),
+    ]
+
+    # Positions:   0   4      11
+    assert parser("“Hi”“there”") == [
+        (0, 4), (4, 11),
+    ]
+
     # With Narrator breaks
     CONFIG.dialogLine = ""
     CONFIG.narratorBreak = nwUnicode.U_EMDASH
@@ -486,6 +500,21 @@ def testTextPatterns_DialogParserEnglish():
         (0, 31),
     ]
 
+    # Adjacent narrator breaks are both cut out
+    # Positions:   0    5                  24    30
+    assert parser("“Hi, —said he——and she—, bye.”") == [
+        (0, 5), (24, 30),
+    ]
+
+    # Removing the narrator break symbol also removes the breaks
+    CONFIG.narratorBreak = ""
+    parser.initParser()
+
+    # Positions:   0                                                         58
+    assert parser("“Simple dialogue, — argued John, — is not always so easy.”") == [
+        (0, 58),
+    ]
+
 
 @pytest.mark.core
 def testTextPatterns_DialogParserSpanish():
@@ -553,6 +582,12 @@ def testTextPatterns_DialogParserPortuguese():
         (0, 12), (29, 49),
     ]
 
+    # Adjacent narrator breaks are both cut out
+    # Positions:   0     6             20 23
+    assert parser("— Sim — ele —— ela — ok") == [
+        (0, 6), (20, 23),
+    ]
+
 
 @pytest.mark.core
 def testTextPatterns_DialogParserPolish():
@@ -569,6 +604,7 @@ def testTextPatterns_DialogParserPolish():
 
     parser = DialogParser()
     parser.initParser()
+    assert parser._symbols == nwUnicode.U_ENDASH
 
     # This is what an example dialogue might look like using Polish punctuation rules
     # See discussion #1976
@@ -598,3 +634,6 @@ def testTextPatterns_DialogParserPolish():
         "And so on and so forth. However, \"text in quotation marks\" should not be "
         "highlighted at all, and if so, it should be highlighted differently."
     ) == []
+
+    # A closing dash at the end of the text does not open a new section
+    assert parser("– Oh my! –") == [(0, 9)]
@@ -49,6 +49,7 @@ def testToolBuildSettings_Init(qtbot, nwGUI, projPath, mockRnd):
     bSettings = GuiBuildSettings(nwGUI, build)
     bSettings.show()
     bSettings.loadContent()
+    assert bSettings._optTabHeadings is None
 
     # Flip through pages
     button = bSettings.sidebar._group.button(bSettings.OPT_FORMATTING + 1)
@@ -66,6 +67,35 @@ def testToolBuildSettings_Init(qtbot, nwGUI, projPath, mockRnd):
     button.click()
     assert isinstance(bSettings.toolStack.currentWidget(), _FilterTab)
 
+    # The filter tree is built when the tab is shown
+    filterTab = bSettings.optTabSelect
+    assert filterTab.optTree.topLevelItemCount() == 4
+    bSettings.sidebar._group.button(bSettings.OPT_FORMATTING + 1).click()  # type: ignore
+    filterTab.optTree.clear()
+    filterTab.loadContent()
+    assert filterTab._treePending is True
+    assert filterTab.optTree.topLevelItemCount() == 0
+    bSettings.sidebar._group.button(bSettings.OPT_FILTERS).click()  # type: ignore
+    assert filterTab._treePending is False
+    assert filterTab.optTree.topLevelItemCount() == 4
+
+    # The icon cache is rebuilt with the tree
+    mainIcons = filterTab._mainIcons
+    assert len(mainIcons) > 0
+    filterTab._populateTree()
+    assert filterTab._mainIcons is not mainIcons
+
+    # Root switch changes are also deferred while hidden
+    bSettings.sidebar._group.button(bSettings.OPT_FORMATTING + 1).click()  # type: ignore
+    filterTab._applyFilterSwitch(f"root:{C.hPlotRoot}", False)
+    assert filterTab._treePending is True
+    assert filterTab.optTree.topLevelItemCount() == 4
+    bSettings.sidebar._group.button(bSettings.OPT_FILTERS).click()  # type: ignore
+    assert filterTab._treePending is False
+    assert filterTab.optTree.topLevelItemCount() == 3
+    filterTab._applyFilterSwitch(f"root:{C.hPlotRoot}", True)
+    assert filterTab.optTree.topLevelItemCount() == 4
+
     # Check dialog buttons
     triggered = False
 